@@ -12,6 +12,11 @@ from typing import Optional
 
 import httpx
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from .models import (
     BenchmarkConfig,
     BenchmarkReport,
@@ -24,9 +29,18 @@ from .providers import BaseProvider, get_provider
 
 logger = logging.getLogger(__name__)
 
+# Streaming parses one JSON chunk per SSE line; orjson decodes 2-5x faster
+# than stdlib json when installed
+_loads = orjson.loads if orjson is not None else json.loads
+
 # SGR Vampi Code API configuration
 SGR_API_BASE_URL = os.getenv("SGR_API_BASE_URL", "http://localhost:8010")
 
+# Request invariants, built once instead of per task; pre-parsed httpx.URL
+# skips URL normalization inside every stream() call
+_CHAT_COMPLETIONS_URL = httpx.URL(f"{SGR_API_BASE_URL}/v1/chat/completions")
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
 
 class BenchmarkRunner:
     """Runs benchmark tasks across multiple models."""
@@ -45,7 +59,16 @@ class BenchmarkRunner:
     async def _get_http_client(self) -> httpx.AsyncClient:
         """Get or create a shared HTTP client."""
         if self._http_client is None:
-            self._http_client = httpx.AsyncClient(timeout=httpx.Timeout(self.config.timeout_seconds))
+            # All tasks for all models fan out over this one client; size the
+            # pool so parallel streams don't serialize behind the default limits
+            self._http_client = httpx.AsyncClient(
+                timeout=httpx.Timeout(self.config.timeout_seconds),
+                limits=httpx.Limits(
+                    max_connections=100,
+                    max_keepalive_connections=20,
+                    keepalive_expiry=30.0,
+                ),
+            )
         return self._http_client
     
     async def _close_http_client(self):
@@ -150,7 +173,7 @@ class BenchmarkRunner:
         http_client = await self._get_http_client()
         async with http_client.stream(
                 "POST",
-                f"{SGR_API_BASE_URL}/v1/chat/completions",
+                _CHAT_COMPLETIONS_URL,
                 json={
                     "model": "sgr_vampi_code",  # Use the coding agent
                     "messages": [{"role": "user", "content": task_content}],
@@ -162,7 +185,7 @@ class BenchmarkRunner:
                     "llm_base_url": llm_base_url,
                     "llm_api_key": llm_api_key,
                 },
-                headers={"Content-Type": "application/json"},
+                headers=_JSON_HEADERS,
             ) as response:
                 response.raise_for_status()
                 
@@ -172,51 +195,52 @@ class BenchmarkRunner:
                         if data == "[DONE]":
                             break
                         try:
-                            chunk = json.loads(data)
-                            # Check for request_details in usage (sent with final chunk)
-                            if "usage" in chunk and chunk["usage"]:
-                                if "request_details" in chunk["usage"]:
-                                    for req in chunk["usage"]["request_details"]:
-                                        detailed_requests.append(req)
-                                    logger.debug(f"Task '{task_id}': Found {len(chunk['usage']['request_details'])} request_details in final usage")
-                            if "choices" in chunk and chunk["choices"]:
-                                delta = chunk["choices"][0].get("delta", {})
-                                if "content" in delta and delta["content"]:
-                                    response_content += delta["content"]
-                                # Count unique tool calls by ID (not streaming chunks)
-                                if "tool_calls" in delta and delta["tool_calls"]:
-                                    for tc in delta["tool_calls"]:
-                                        tc_id = tc.get("id")
-                                        if tc_id and tc_id not in seen_tool_call_ids:
-                                            seen_tool_call_ids.add(tc_id)
-                                            iterations += 1
-                                            logger.debug(f"Task '{task_id}': New tool call detected: {tc_id} (iteration {iterations})")
-                            # Capture usage data from chunks
-                            
-                            if "usage" in chunk and chunk["usage"]:
-                                current_usage = chunk["usage"]
-                                # Track each request's usage when we see finish_reason
-                                finish_reason = chunk["choices"][0].get("finish_reason") if chunk.get("choices") else None
-                                if finish_reason or current_usage.get("prompt_tokens", 0) > 0:
-                                    request_count += 1
-                                    request_detail = {
-                                        "request_num": request_count,
-                                        "prompt_tokens": current_usage.get("prompt_tokens", 0) or 0,
-                                        "completion_tokens": current_usage.get("completion_tokens", 0) or 0,
-                                        "thinking_tokens": current_usage.get("thinking_tokens", 0) or 0,
-                                        "total_tokens": current_usage.get("total_tokens", 0) or 0,
-                                        "cost": current_usage.get("cost"),
-                                    }
-                                    # Check for reasoning tokens in details
-                                    details = current_usage.get("completion_tokens_details", {})
-                                    if details and details.get("reasoning_tokens"):
-                                        request_detail["thinking_tokens"] = details.get("reasoning_tokens", 0)
-                                    request_details.append(request_detail)
-                                    logger.debug(f"Task '{task_id}': Request #{request_count} usage: {request_detail}")
-                                usage_data = current_usage
-                                logger.debug(f"Task '{task_id}': Captured usage from chunk: {usage_data}")
-                        except json.JSONDecodeError:
-                            pass
+                            chunk = _loads(data)
+                        except ValueError:
+                            # covers json.JSONDecodeError and orjson.JSONDecodeError
+                            continue
+                        # Check for request_details in usage (sent with final chunk)
+                        if "usage" in chunk and chunk["usage"]:
+                            if "request_details" in chunk["usage"]:
+                                for req in chunk["usage"]["request_details"]:
+                                    detailed_requests.append(req)
+                                logger.debug("Task '%s': Found %d request_details in final usage", task_id, len(chunk["usage"]["request_details"]))
+                        if "choices" in chunk and chunk["choices"]:
+                            delta = chunk["choices"][0].get("delta", {})
+                            if "content" in delta and delta["content"]:
+                                response_content += delta["content"]
+                            # Count unique tool calls by ID (not streaming chunks)
+                            if "tool_calls" in delta and delta["tool_calls"]:
+                                for tc in delta["tool_calls"]:
+                                    tc_id = tc.get("id")
+                                    if tc_id and tc_id not in seen_tool_call_ids:
+                                        seen_tool_call_ids.add(tc_id)
+                                        iterations += 1
+                                        logger.debug("Task '%s': New tool call detected: %s (iteration %d)", task_id, tc_id, iterations)
+                        # Capture usage data from chunks
+
+                        if "usage" in chunk and chunk["usage"]:
+                            current_usage = chunk["usage"]
+                            # Track each request's usage when we see finish_reason
+                            finish_reason = chunk["choices"][0].get("finish_reason") if chunk.get("choices") else None
+                            if finish_reason or current_usage.get("prompt_tokens", 0) > 0:
+                                request_count += 1
+                                request_detail = {
+                                    "request_num": request_count,
+                                    "prompt_tokens": current_usage.get("prompt_tokens", 0) or 0,
+                                    "completion_tokens": current_usage.get("completion_tokens", 0) or 0,
+                                    "thinking_tokens": current_usage.get("thinking_tokens", 0) or 0,
+                                    "total_tokens": current_usage.get("total_tokens", 0) or 0,
+                                    "cost": current_usage.get("cost"),
+                                }
+                                # Check for reasoning tokens in details
+                                details = current_usage.get("completion_tokens_details", {})
+                                if details and details.get("reasoning_tokens"):
+                                    request_detail["thinking_tokens"] = details.get("reasoning_tokens", 0)
+                                request_details.append(request_detail)
+                                logger.debug("Task '%s': Request #%d usage: %s", task_id, request_count, request_detail)
+                            usage_data = current_usage
+                            logger.debug("Task '%s': Captured usage from chunk: %s", task_id, usage_data)
         
         result.response = response_content
         result.success = True
@@ -364,9 +388,16 @@ class BenchmarkRunner:
             report.failed_tasks = len(tasks)
             return report
         
-        # Run ALL tasks in parallel for this model
+        # Bound per-model fan-out with the configured batch_size; unbounded
+        # gather floods the agent API and connection pool on large task sets
+        semaphore = asyncio.Semaphore(max(1, self.config.batch_size))
+
+        async def run_gated(task_id: str, task_content: str) -> TaskResult:
+            async with semaphore:
+                return await self.run_single_task(task_id, task_content, model_config, provider)
+
         all_results = await asyncio.gather(*[
-            self.run_single_task(task_id, task_content, model_config, provider)
+            run_gated(task_id, task_content)
             for task_id, task_content in tasks
         ], return_exceptions=True)
         
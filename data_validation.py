@@ -7,21 +7,64 @@ age verification, and custom order ID patterns.
 """
 
 import re
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import date, datetime
 from typing import Optional
 
 from pydantic import (
     BaseModel,
+    ConfigDict,
     EmailStr,
     Field,
     field_validator,
     model_validator,
 )
 
+# Shared config: frozen models skip assignment-validation machinery.
+# Note frozen=True means post-construction field assignment raises; extra
+# keys in payloads are still ignored as before.
+_STRICT_CONFIG = ConfigDict(frozen=True, validate_assignment=False)
+
+# Precompiled validation patterns; re's internal cache is small and the
+# per-call literal lookup adds up under batch validation
+_ZIP_CODE_RE = re.compile(r"^[A-Za-z0-9\-]+$")
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+_ORDER_ID_RE = re.compile(r"^ORD-[A-Za-z0-9]{5}$")
+
+# Deletion table for phone formatting characters (whitespace, -, (, ), .)
+_PHONE_STRIP = str.maketrans("", "", " \t\n\r\x0b\x0c-().")
+
+# Frozen reference time for batch validation: validating N records from a
+# single logical point in time should cost one clock read, not N
+_validation_now: ContextVar[Optional[datetime]] = ContextVar("_validation_now", default=None)
+
+
+@contextmanager
+def validation_batch():
+    """Freeze 'now' for all validations performed inside the block."""
+    token = _validation_now.set(datetime.now())
+    try:
+        yield
+    finally:
+        _validation_now.reset(token)
+
+
+def _now() -> datetime:
+    frozen = _validation_now.get()
+    return frozen if frozen is not None else datetime.now()
+
+
+def _today() -> date:
+    frozen = _validation_now.get()
+    return frozen.date() if frozen is not None else date.today()
+
 
 class Address(BaseModel):
     """Address model with basic address fields."""
 
+    model_config = _STRICT_CONFIG
+
     street: str = Field(..., min_length=1, description="Street address")
     city: str = Field(..., min_length=1, description="City name")
     state: str = Field(..., min_length=1, description="State or province")
@@ -34,7 +77,7 @@ class Address(BaseModel):
         """Validate zip code format (allows various international formats)."""
         # Remove spaces and validate it's alphanumeric with optional hyphens
         cleaned = v.replace(" ", "")
-        if not re.match(r"^[A-Za-z0-9\-]+$", cleaned):
+        if not _ZIP_CODE_RE.match(cleaned):
             raise ValueError("ZIP code must contain only letters, numbers, and hyphens")
         return v
 
@@ -42,6 +85,8 @@ class Address(BaseModel):
 class Person(BaseModel):
     """Person model with contact information and age validation."""
 
+    model_config = _STRICT_CONFIG
+
     first_name: str = Field(..., min_length=1, max_length=50, description="First name")
     last_name: str = Field(..., min_length=1, max_length=50, description="Last name")
     email: EmailStr = Field(..., description="Email address")
@@ -56,11 +101,11 @@ class Person(BaseModel):
         if v is None:
             return v
 
-        # Remove common formatting characters for validation
-        cleaned = re.sub(r"[\s\-\(\)\.]", "", v)
-
-        # Check if it starts with optional + and contains only digits
-        if not re.match(r"^\+?\d{7,15}$", cleaned):
+        # Single C-level pass: strip formatting characters, then check the
+        # optional + prefix and digit count without a regex engine
+        cleaned = v.translate(_PHONE_STRIP)
+        digits = cleaned[1:] if cleaned.startswith("+") else cleaned
+        if not (digits.isdecimal() and 7 <= len(digits) <= 15):
             raise ValueError(
                 "Phone number must be 7-15 digits, optionally starting with '+' "
                 "for international format"
@@ -71,7 +116,7 @@ class Person(BaseModel):
     @classmethod
     def validate_age(cls, v: date) -> date:
         """Ensure the person is at least 18 years old."""
-        today = date.today()
+        today = _today()
 
         # Calculate age
         age = today.year - v.year - ((today.month, today.day) < (v.month, v.day))
@@ -98,9 +143,30 @@ class Person(BaseModel):
         )
 
 
+class PersonFast(Person):
+    """Person variant with lightweight email validation for bulk ingestion.
+
+    EmailStr runs email-validator's full RFC/IDN parsing, which dominates
+    Person construction cost in batch paths; this swaps it for a single
+    RFC-5322-lite regex match. Use Person where strict checking matters.
+    """
+
+    email: str = Field(..., description="Email address (lightweight validation)")
+
+    @field_validator("email")
+    @classmethod
+    def validate_email_fast(cls, v: str) -> str:
+        """Validate email shape with one regex match instead of email-validator."""
+        if not _EMAIL_RE.match(v):
+            raise ValueError("Email must look like local@domain.tld")
+        return v
+
+
 class OrderItem(BaseModel):
     """Individual item in an order."""
 
+    model_config = _STRICT_CONFIG
+
     product_name: str = Field(..., min_length=1, description="Product name")
     quantity: int = Field(..., gt=0, description="Quantity (must be positive)")
     unit_price: float = Field(..., gt=0, description="Unit price (must be positive)")
@@ -114,12 +180,14 @@ class OrderItem(BaseModel):
 class Order(BaseModel):
     """Order model with customer, items, and validation rules."""
 
+    model_config = _STRICT_CONFIG
+
     order_id: str = Field(..., description="Order ID in format ORD-XXXXX")
     customer: Person = Field(..., description="Customer information")
-    items: list[OrderItem] = Field(..., min_length=1, description="Order items")
+    items: tuple[OrderItem, ...] = Field(..., min_length=1, description="Order items")
     total_amount: float = Field(..., gt=0, description="Total amount (must be positive)")
     created_at: datetime = Field(
-        default_factory=datetime.now,
+        default_factory=_now,
         description="Order creation timestamp"
     )
 
@@ -127,14 +195,28 @@ class Order(BaseModel):
     @classmethod
     def validate_order_id(cls, v: str) -> str:
         """Validate order ID follows pattern ORD-XXXXX (5 alphanumeric characters)."""
-        pattern = r"^ORD-[A-Za-z0-9]{5}$"
-        if not re.match(pattern, v):
+        if not _ORDER_ID_RE.match(v):
             raise ValueError(
                 "Order ID must follow pattern 'ORD-XXXXX' where X is alphanumeric "
                 f"(e.g., 'ORD-12345', 'ORD-AB123'). Got: '{v}'"
             )
         return v.upper()  # Normalize to uppercase
 
+    @classmethod
+    def trusted_create(cls, **kwargs) -> "Order":
+        """Build an Order from already-validated data, skipping field validation.
+
+        For internal high-throughput producers whose values are known good;
+        only the structural invariants get a cheap sanity check.
+        """
+        if not kwargs.get("items"):
+            raise ValueError("items cannot be empty")
+        if not kwargs.get("total_amount", 0) > 0:
+            raise ValueError("total_amount must be positive")
+        kwargs["items"] = tuple(kwargs["items"])
+        kwargs.setdefault("created_at", _now())
+        return cls.model_construct(**kwargs)
+
     @model_validator(mode="after")
     def validate_total_matches_items(self) -> "Order":
         """Validate that total_amount reasonably matches the sum of items."""
@@ -3,6 +3,10 @@ from datetime import date, datetime
 from typing import List, Optional
 import re
 
+# Compiled once at import instead of per validation call
+_PHONE_RE = re.compile(r'^\+?\d[\d\s\-\(\)]{9,16}$')
+_ORDER_ID_RE = re.compile(r'^ORD-\\d{5}$')
+
 class Address(BaseModel):
     street: str
     city: str
@@ -23,8 +27,7 @@ class Person(BaseModel):
     def validate_phone(cls, v):
         if v is None:
             return v
-        pattern = r'^\+?\d[\d\s\-\(\)]{9,16}$'
-        if not re.match(pattern, v):
+        if not _PHONE_RE.match(v):
             raise ValueError('Phone number must be a valid format (10-15 digits with optional + and separators)')
         return v
 
@@ -47,7 +50,7 @@ class Order(BaseModel):
     @field_validator('order_id')
     @classmethod
     def validate_order_id(cls, v):
-        if not re.match(r'^ORD-\\d{5}$', v):
+        if not _ORDER_ID_RE.match(v):
             raise ValueError('order_id must follow the pattern "ORD-XXXXX" where X are digits')
         return v
 
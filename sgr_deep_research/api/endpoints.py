@@ -96,7 +96,7 @@ async def provide_clarification(agent_id: str, request: ClarificationRequest):
 
     except Exception as e:
         logger.error(f"Error completion: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+        raise HTTPException(status_code=500, detail=str(e)) from e
 
 
 def _is_agent_id(model_str: str) -> bool:
@@ -161,4 +161,4 @@ async def create_chat_completion(request: ChatCompletionRequest):
         )
 
     except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
+        raise HTTPException(status_code=400, detail=str(e)) from e
@@ -23,6 +23,21 @@ from sgr_deep_research.settings import get_config
 
 config = get_config()
 
+# One proxy client shared by every agent: benchmarks spawn many agents, and a
+# per-agent httpx.AsyncClient means a separate connection pool (fresh TCP+TLS
+# handshakes) for each of them
+_proxy_http_client: httpx.AsyncClient | None = None
+
+
+def _get_proxy_http_client() -> httpx.AsyncClient:
+    global _proxy_http_client
+    if _proxy_http_client is None:
+        _proxy_http_client = httpx.AsyncClient(
+            proxy=config.openai.proxy,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=30.0),
+        )
+    return _proxy_http_client
+
 
 class BaseAgent:
     """Base class for agents."""
@@ -63,7 +78,7 @@ class BaseAgent:
 
         client_kwargs = {"base_url": self.llm_base_url, "api_key": self.llm_api_key}
         if config.openai.proxy.strip():
-            client_kwargs["http_client"] = httpx.AsyncClient(proxy=config.openai.proxy)
+            client_kwargs["http_client"] = _get_proxy_http_client()
 
         self.openai_client = AsyncOpenAI(**client_kwargs)
         self.streaming_generator = OpenAIStreamingGenerator(model=self.id)
@@ -154,7 +169,7 @@ class BaseAgent:
         """Receive clarification from external source (e.g. user input)"""
         self.conversation.append({"role": "user", "content": PromptLoader.get_clarification_template(clarifications)})
         self._context.clarifications_used += 1
-        self._context.clarification_received.set()
+        self._context.clarification_event().set()
         self._context.state = AgentStatesEnum.RESEARCHING
         self.logger.info(f"✅ Clarification received: {clarifications[:2000]}...")
 
@@ -2,13 +2,23 @@ import asyncio
 import logging
 from datetime import datetime
 from enum import Enum
-from typing import Any
+from typing import Any, ClassVar, Iterable
 
 from pydantic import BaseModel, Field
 
 _token_usage_logger = logging.getLogger(__name__)
 
 
+def _truncate(s: str | None, n: int) -> str | None:
+    """Truncate a string to n characters, allocating only when over the limit."""
+    return s if s is None or len(s) <= n else f"{s[:n]}..."
+
+
+# Storage limits for per-request benchmark tracking
+_MSG_TRUNC = 2000
+_RESPONSE_TRUNC = 5000
+
+
 class SourceData(BaseModel):
     """Data about a research source."""
 
@@ -22,6 +32,11 @@ class SourceData(BaseModel):
     def __str__(self):
         return f"[{self.number}] {self.title or 'Untitled'} - {self.url}"
 
+    @classmethod
+    def build_trusted(cls, **kwargs) -> "SourceData":
+        """Build instance from already-validated internal data, skipping field validation."""
+        return cls.model_construct(**kwargs)
+
 
 class SearchResult(BaseModel):
     """Search result with query, answer, and sources."""
@@ -34,6 +49,11 @@ class SearchResult(BaseModel):
     def __str__(self):
         return f"Search: '{self.query}' ({len(self.citations)} sources)"
 
+    @classmethod
+    def build_trusted(cls, **kwargs) -> "SearchResult":
+        """Build instance from already-validated internal data, skipping field validation."""
+        return cls.model_construct(**kwargs)
+
 
 class AgentStatesEnum(str, Enum):
     INITED = "inited"
@@ -61,15 +81,35 @@ class ResearchContext(BaseModel):
     searches_used: int = Field(default=0, description="Number of searches performed")
 
     clarifications_used: int = Field(default=0, description="Number of clarifications requested")
-    clarification_received: asyncio.Event = Field(
-        default_factory=asyncio.Event, description="Event for clarification synchronization"
+    clarification_received: asyncio.Event | None = Field(
+        default=None, exclude=True, description="Event for clarification synchronization (lazily created)"
     )
     
     working_directory: str = Field(default=".", description="Working directory for file operations")
 
+    def extend_sources(self, new_items: Iterable[tuple[str, SourceData]]) -> None:
+        """Bulk-insert sources keyed by URL.
+
+        Building the intermediate dict once pre-sizes the insert, so the
+        sources dict grows in a single resize instead of rehashing per item.
+        """
+        self.sources.update(dict(new_items))
+
+    def clarification_event(self) -> asyncio.Event:
+        """Return the clarification event, creating it on first use.
+
+        Lazy construction avoids binding an asyncio.Event to an event loop
+        when the context is built from synchronous code paths.
+        """
+        if self.clarification_received is None:
+            self.clarification_received = asyncio.Event()
+        return self.clarification_received
+
+    _AGENT_STATE_EXCLUDE: ClassVar[frozenset[str]] = frozenset({"searches", "sources", "clarification_received"})
+
     # ToDO: rename, my creativity finished now
     def agent_state(self) -> dict:
-        return self.model_dump(exclude={"searches", "sources", "clarification_received"})
+        return self.model_dump(exclude=self._AGENT_STATE_EXCLUDE)
 
 
 class TokenUsage(BaseModel):
@@ -82,8 +122,13 @@ class TokenUsage(BaseModel):
     cached_tokens: int = Field(default=0, description="Cached prompt tokens (if available)")
     cost: float = Field(default=0.0, description="Total cost in USD from API")
     
-    # Per-request detailed tracking for benchmarking
-    request_details: list = Field(default_factory=list, description="Detailed per-request data including prompts and outputs")
+    # Per-request detailed tracking for benchmarking.
+    # Stored as parallel columns (SoA) instead of a list of per-request dicts:
+    # cheaper to allocate and to aggregate over long sessions.
+    request_nums: list[int] = Field(default_factory=list, description="Request numbers (1-indexed)")
+    request_prompts: list[list] = Field(default_factory=list, description="Truncated prompt messages per request")
+    request_responses: list[str] = Field(default_factory=list, description="Truncated response content per request")
+    request_usages: list[dict] = Field(default_factory=list, description="Token usage per request")
     
     def add_usage(self, usage) -> None:
         """Add usage from an OpenAI response.
@@ -94,25 +139,37 @@ class TokenUsage(BaseModel):
         if usage is None:
             return
         
-        # Debug: Log raw usage object to understand what we're receiving
-        _token_usage_logger.debug(f"Raw usage object type: {type(usage)}")
-        _token_usage_logger.debug(f"Raw usage object: {usage}")
+        # Debug: Log raw usage object to understand what we're receiving.
+        # Lazy %-formatting: these run per LLM response and must cost nothing
+        # when debug logging is off.
+        _token_usage_logger.debug("Raw usage object type: %s", type(usage))
+        _token_usage_logger.debug("Raw usage object: %s", usage)
         if hasattr(usage, '__dict__'):
-            _token_usage_logger.debug(f"Usage __dict__: {usage.__dict__}")
+            _token_usage_logger.debug("Usage __dict__: %s", usage.__dict__)
         if hasattr(usage, 'model_extra'):
-            _token_usage_logger.debug(f"Usage model_extra: {usage.model_extra}")
+            _token_usage_logger.debug("Usage model_extra: %s", usage.model_extra)
         
         if hasattr(usage, 'prompt_tokens'):
-            self.prompt_tokens += getattr(usage, 'prompt_tokens', 0) or 0
-            self.completion_tokens += getattr(usage, 'completion_tokens', 0) or 0
-            self.total_tokens += getattr(usage, 'total_tokens', 0) or 0
-            
+            response_prompt = getattr(usage, 'prompt_tokens', 0) or 0
+            response_completion = getattr(usage, 'completion_tokens', 0) or 0
+            response_total = getattr(usage, 'total_tokens', 0) or 0
+            self.prompt_tokens += response_prompt
+            self.completion_tokens += response_completion
+
             # Extract thinking/reasoning tokens from completion_tokens_details
+            response_thinking = 0
             if hasattr(usage, 'completion_tokens_details') and usage.completion_tokens_details:
                 details = usage.completion_tokens_details
                 if hasattr(details, 'reasoning_tokens'):
-                    self.thinking_tokens += details.reasoning_tokens or 0
-            
+                    response_thinking = details.reasoning_tokens or 0
+            self.thinking_tokens += response_thinking
+
+            # Normalize the provider's total here so to_dict is a plain dump:
+            # some providers include thinking tokens in total, others don't.
+            if response_thinking > 0 and response_total <= response_prompt + response_completion:
+                response_total = response_prompt + response_completion + response_thinking
+            self.total_tokens += response_total
+
             # Extract cached tokens from prompt_tokens_details (OpenRouter format)
             if hasattr(usage, 'prompt_tokens_details') and usage.prompt_tokens_details:
                 prompt_details = usage.prompt_tokens_details
@@ -129,28 +186,36 @@ class TokenUsage(BaseModel):
             if cost_val is None and hasattr(usage, '__dict__'):
                 cost_val = usage.__dict__.get('cost')
             
-            _token_usage_logger.debug(f"Extracted cost_val: {cost_val}")
+            _token_usage_logger.debug("Extracted cost_val: %s", cost_val)
             if cost_val is not None:
                 self.cost += float(cost_val)
                 _token_usage_logger.info(f"API cost extracted: ${cost_val}")
             else:
                 _token_usage_logger.warning("No cost found in API response - will use fallback calculation")
         elif isinstance(usage, dict):
-            self.prompt_tokens += usage.get('prompt_tokens', 0) or 0
-            self.completion_tokens += usage.get('completion_tokens', 0) or 0
-            self.total_tokens += usage.get('total_tokens', 0) or 0
-            self.thinking_tokens += usage.get('thinking_tokens', 0) or 0
+            response_prompt = usage.get('prompt_tokens', 0) or 0
+            response_completion = usage.get('completion_tokens', 0) or 0
+            response_total = usage.get('total_tokens', 0) or 0
+            response_thinking = usage.get('thinking_tokens', 0) or 0
+            self.prompt_tokens += response_prompt
+            self.completion_tokens += response_completion
             self.cached_tokens += usage.get('cached_tokens', 0) or 0
             # Also check nested details format
             completion_details = usage.get('completion_tokens_details', {})
             if completion_details:
-                self.thinking_tokens += completion_details.get('reasoning_tokens', 0) or 0
+                response_thinking += completion_details.get('reasoning_tokens', 0) or 0
+            self.thinking_tokens += response_thinking
+            # Same normalization as the attribute branch: fold thinking into
+            # total if the provider did not already count it there.
+            if response_thinking > 0 and response_total <= response_prompt + response_completion:
+                response_total = response_prompt + response_completion + response_thinking
+            self.total_tokens += response_total
             prompt_details = usage.get('prompt_tokens_details', {})
             if prompt_details:
                 self.cached_tokens += prompt_details.get('cached_tokens', 0) or 0
             # Extract cost from dict (OpenRouter provides this)
             cost_val = usage.get('cost')
-            _token_usage_logger.debug(f"Dict cost_val: {cost_val}")
+            _token_usage_logger.debug("Dict cost_val: %s", cost_val)
             if cost_val is not None:
                 self.cost += float(cost_val)
                 _token_usage_logger.info(f"API cost extracted from dict: ${cost_val}")
@@ -164,59 +229,58 @@ class TokenUsage(BaseModel):
             response_content: The LLM's response content
             usage: Token usage for this specific request
         """
-        # Truncate prompt messages for storage (keep structure but limit content size)
-        truncated_messages = []
-        for msg in prompt_messages:
-            truncated_msg = {"role": msg.get("role", "unknown")}
-            content = msg.get("content", "")
-            if content:
-                truncated_msg["content"] = content[:2000] + "..." if len(content) > 2000 else content
-            else:
-                truncated_msg["content"] = None
-            if "tool_calls" in msg:
-                truncated_msg["tool_calls"] = msg["tool_calls"]
-            truncated_messages.append(truncated_msg)
-        
-        self.request_details.append({
-            "request_num": request_num,
-            "prompt_messages": truncated_messages,
-            "response_content": response_content[:5000] if len(response_content) > 5000 else response_content,
-            "usage": usage or {},
-        })
+        # Truncate prompt messages for storage (keep structure but limit content size).
+        # Stored as (role, content, tool_calls) tuples; dicts are rebuilt lazily.
+        truncated_messages = [
+            (
+                msg.get("role", "unknown"),
+                _truncate(msg.get("content") or None, _MSG_TRUNC),
+                msg.get("tool_calls"),
+            )
+            for msg in prompt_messages
+        ]
+
+        self.request_nums.append(request_num)
+        self.request_prompts.append(truncated_messages)
+        self.request_responses.append(_truncate(response_content, _RESPONSE_TRUNC))
+        self.request_usages.append(usage or {})
+
+    def request_details_iter(self):
+        """Yield per-request detail dicts, rebuilt from the columnar storage."""
+        for request_num, prompt_messages, response_content, usage in zip(
+            self.request_nums, self.request_prompts, self.request_responses, self.request_usages
+        ):
+            messages = []
+            for role, content, tool_calls in prompt_messages:
+                message = {"role": role, "content": content}
+                if tool_calls is not None:
+                    message["tool_calls"] = tool_calls
+                messages.append(message)
+            yield {
+                "request_num": request_num,
+                "prompt_messages": messages,
+                "response_content": response_content,
+                "usage": usage,
+            }
     
     def to_dict(self) -> dict:
         """Return usage as dictionary.
-        
-        Ensures total_tokens includes thinking_tokens if they're not already counted.
-        Some providers include thinking tokens in total, others don't.
+
+        total_tokens is already normalized to include thinking_tokens in
+        add_usage, so this is a plain attribute dump.
         """
-        # Calculate what total should be: prompt + completion
-        calculated_total = self.prompt_tokens + self.completion_tokens
-        
-        # If API total matches calculated, thinking tokens might not be included
-        # If thinking tokens exist and total doesn't seem to include them, add them
-        final_total = self.total_tokens
-        if self.thinking_tokens > 0:
-            # Check if thinking tokens are already included in total
-            # If total equals prompt + completion, thinking is NOT included
-            if self.total_tokens == calculated_total:
-                final_total = self.total_tokens + self.thinking_tokens
-            # If total is less than calculated + thinking, it's likely not included
-            elif self.total_tokens < calculated_total + self.thinking_tokens:
-                final_total = calculated_total + self.thinking_tokens
-        
         result = {
             "prompt_tokens": self.prompt_tokens,
             "completion_tokens": self.completion_tokens,
-            "total_tokens": final_total,
+            "total_tokens": self.total_tokens,
             "thinking_tokens": self.thinking_tokens,
             "cached_tokens": self.cached_tokens,
             "cost": self.cost,
         }
         
         # Include request_details if available
-        if self.request_details:
-            result["request_details"] = self.request_details
+        if self.request_nums:
+            result["request_details"] = list(self.request_details_iter())
         
         return result
 
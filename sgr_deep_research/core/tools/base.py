@@ -2,13 +2,11 @@ from __future__ import annotations
 
 import json
 import logging
-import operator
 from abc import ABC
-from functools import reduce
-from typing import TYPE_CHECKING, Annotated, ClassVar, Literal, Type, TypeVar
+from typing import TYPE_CHECKING, Annotated, ClassVar, Literal, Type, TypeVar, Union
 
 from fastmcp import Client
-from pydantic import BaseModel, Field, create_model
+from pydantic import BaseModel, ConfigDict, Field, create_model
 
 from sgr_deep_research.core.models import AgentStatesEnum
 from sgr_deep_research.settings import get_config
@@ -16,24 +14,66 @@ from sgr_deep_research.settings import get_config
 if TYPE_CHECKING:
     from sgr_deep_research.core.models import ResearchContext
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 config = get_config()
 logger = logging.getLogger(__name__)
 
 
+def _dump_json_indented(model: BaseModel) -> str:
+    """Serialize a model to indented JSON, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(model.model_dump(), option=orjson.OPT_INDENT_2).decode()
+    return model.model_dump_json(indent=2)
+
+
+class _classproperty:
+    """Read-only computed class attribute, usable on both class and instance."""
+
+    def __init__(self, fget):
+        self.fget = fget
+
+    def __get__(self, obj, owner=None):
+        return self.fget(owner if owner is not None else type(obj))
+
+
 class BaseTool(BaseModel):
     """Class to provide tool handling capabilities."""
 
-    tool_name: ClassVar[str] = None
-    description: ClassVar[str] = None
+    # Without ignored_types pydantic rejects the unannotated _classproperty
+    # attributes below at class creation
+    model_config = ConfigDict(ignored_types=(_classproperty,))
+
+    # Computed lazily via descriptors below instead of mutating ClassVars in
+    # __init_subclass__, which triggered pydantic schema rebuilds for every
+    # synthetic D_* subclass. Subclasses may still shadow with plain class
+    # attributes (e.g. MCP tool generation).
+    _tool_name: ClassVar[str | None] = None
+    _description: ClassVar[str | None] = None
 
     async def __call__(self, context: ResearchContext) -> str:
         """Result should be a string or dumped json."""
         raise NotImplementedError("Execute method must be implemented by subclass")
 
-    def __init_subclass__(cls, **kwargs):
-        super().__init_subclass__(**kwargs)
-        cls.tool_name = cls.tool_name or cls.__name__.lower()
-        cls.description = cls.description or cls.__doc__ or ""
+    @_classproperty
+    def tool_name(cls) -> str:  # noqa: N805
+        return cls._tool_name or cls.__name__.lower()
+
+    @_classproperty
+    def description(cls) -> str:  # noqa: N805
+        if cls._description:
+            return cls._description
+        # First docstring below BaseTool in the MRO: a docstring-less direct
+        # subclass reports "" as before, never BaseTool's own docstring
+        for klass in cls.__mro__:
+            if klass is BaseTool:
+                break
+            if klass.__doc__:
+                return klass.__doc__
+        return ""
 
 
 class MCPBaseTool(BaseTool):
@@ -46,9 +86,9 @@ class MCPBaseTool(BaseTool):
         try:
             async with self._client:
                 result = await self._client.call_tool(self.tool_name, payload)
-                return json.dumps([m.model_dump_json() for m in result.content], ensure_ascii=False)[
-                    : config.mcp.context_limit
-                ]
+                # Single encode pass instead of JSON-in-JSON per content item
+                payloads = [m.model_dump(mode="json") for m in result.content]
+                return json.dumps(payloads, ensure_ascii=False)[: config.mcp.context_limit]
         except Exception as e:
             logger.error(f"Error processing MCP tool {self.tool_name}: {e}")
             return f"Error: {e}"
@@ -104,16 +144,13 @@ class FinalAnswerTool(BaseTool):
         "For repository analysis: MUST include directory tree structure in code block, sections for structure, "
         "architecture, dependencies, code quality, metrics in tables, code examples, and actionable recommendations."
     )
-    status: Literal[AgentStatesEnum.COMPLETED, AgentStatesEnum.FAILED, AgentStatesEnum.ERROR] = Field(
-        description="Task completion status"
-    )
+    # Plain string Literal validates with a dict lookup, cheaper than enum coercion
+    status: Literal["completed", "failed", "error"] = Field(description="Task completion status")
 
     async def __call__(self, context: ResearchContext) -> str:
-        context.state = self.status
+        context.state = AgentStatesEnum(self.status)
         context.execution_result = self.answer
-        return self.model_dump_json(
-            indent=2,
-        )
+        return _dump_json_indented(self)
 
 
 class ReasoningTool(BaseTool):
@@ -155,9 +192,7 @@ class ReasoningTool(BaseTool):
     task_completed: bool = Field(description="Is the research task finished?")
 
     async def __call__(self, *args, **kwargs):
-        return self.model_dump_json(
-            indent=2,
-        )
+        return _dump_json_indented(self)
 
 
 T = TypeVar("T", bound=BaseTool)
@@ -171,29 +206,40 @@ class NextStepToolStub(ReasoningTool, ABC):
 
 
 class DiscriminantToolMixin(BaseModel):
-    tool_name_discriminator: str = Field(..., description="Tool name discriminator")
-
-    def model_dump(self, *args, **kwargs):
-        # it could cause unexpected field issues if not excluded
-        exclude = kwargs.pop("exclude", set())
-        exclude = exclude.union({"tool_name_discriminator"})
-        return super().model_dump(*args, exclude=exclude, **kwargs)
+    # excluded from dumps at field level (see _create_discriminant_tool),
+    # it could cause unexpected field issues otherwise
+    tool_name_discriminator: str = Field(..., description="Tool name discriminator", exclude=True)
 
 
 class NextStepToolsBuilder:
     """SGR Core - Builder for NextStepTool with dynamic union tool function type on
     pydantic models level."""
 
+    # create_model is expensive (schema + validator rebuild); memoize per tool set
+    _discriminant_cache: ClassVar[dict[Type, Type[BaseModel]]] = {}
+    _next_step_tools_cache: ClassVar[dict[tuple, Type[NextStepToolStub]]] = {}
+
     @classmethod
     def _create_discriminant_tool(cls, tool_class: Type[T]) -> Type[BaseModel]:
         """Create discriminant version of tool with tool_name as instance
         field."""
+        cached = cls._discriminant_cache.get(tool_class)
+        if cached is not None:
+            return cached
 
-        return create_model(  # noqa
+        discriminant_tool = create_model(  # noqa
             f"D_{tool_class.__name__}",
             __base__=(tool_class, DiscriminantToolMixin),  # the order matters here
-            tool_name_discriminator=(Literal[tool_class.tool_name], Field(..., description="Tool name discriminator")),
+            tool_name_discriminator=(
+                Literal[tool_class.tool_name],
+                Field(..., description="Tool name discriminator", exclude=True),
+            ),
         )
+        # Keep the wrapped tool's identity instead of the synthetic D_* name
+        discriminant_tool._tool_name = tool_class.tool_name
+        discriminant_tool._description = tool_class.description
+        cls._discriminant_cache[tool_class] = discriminant_tool
+        return discriminant_tool
 
     @classmethod
     def _create_tool_types_union(cls, tools_list: list[Type[T]]) -> Type:
@@ -202,16 +248,24 @@ class NextStepToolsBuilder:
             return cls._create_discriminant_tool(tools_list[0])
         # SGR inference struggles with choosing right schema otherwise
         discriminant_tools = [cls._create_discriminant_tool(tool) for tool in tools_list]
-        union = reduce(operator.or_, discriminant_tools)
+        # Single flattened union instead of an O(N) chain of `a | b | c` intermediates
+        union = Union[tuple(discriminant_tools)]  # type: ignore[valid-type]
         return Annotated[union, Field()]
 
     @classmethod
     def build_NextStepTools(cls, tools_list: list[Type[T]]) -> Type[NextStepToolStub]:  # noqa
-        return create_model(
+        cache_key = tuple(tools_list)
+        cached = cls._next_step_tools_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        next_step_tools = create_model(
             "NextStepTools",
             __base__=NextStepToolStub,
             function=(cls._create_tool_types_union(tools_list), Field()),
         )
+        cls._next_step_tools_cache[cache_key] = next_step_tools
+        return next_step_tools
 
 
 system_agent_tools = [
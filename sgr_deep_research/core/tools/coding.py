@@ -1,9 +1,20 @@
 """Coding tools for repository operations using OS-level commands."""
 
 import asyncio
+import fnmatch
+import functools
+import io
 import logging
+import mmap
 import os
+import re
+import shutil
+import signal
+import stat
 import subprocess
+import tempfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import TYPE_CHECKING, ClassVar
 
@@ -16,6 +27,150 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# ripgrep is preferred over grep/find when present: parallel traversal,
+# .gitignore awareness and binary skipping. Falls back to the POSIX tools.
+_RG_PATH = shutil.which("rg")
+
+# Directory walks are I/O-bound; the GIL is released during getdents
+_WALK_WORKERS = min(32, (os.cpu_count() or 4) * 4)
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_search_pattern(pattern: str, case_insensitive: bool) -> re.Pattern:
+    """Compiled-pattern cache for GrepTool's in-process search path.
+
+    Agents tend to repeat the same pattern across iterative exploration calls;
+    caching amortizes the compile cost over the session.
+    """
+    return re.compile(pattern, re.IGNORECASE if case_insensitive else 0)
+
+
+@functools.lru_cache(maxsize=64)
+def _resolve_base(working_directory: str) -> Path:
+    """Resolve a working directory once per distinct value.
+
+    Path.resolve() issues several stat/readlink syscalls, and agent loops call
+    into these tools with the same working directory over and over.
+    """
+    return Path(working_directory).expanduser().resolve()
+
+
+@functools.lru_cache(maxsize=512)
+def _resolve_rel(working_directory: str, file_path: str) -> Path:
+    """Resolve a tool file path against the working directory, cached.
+
+    Read/edit loops hit the same (cwd, path) pairs repeatedly; caching skips
+    the stat/readlink chain resolve() performs each time. Resolution does not
+    depend on the file existing, so entries stay valid across creates and
+    deletes — symlink retargeting mid-session is the accepted staleness.
+    """
+    path = Path(file_path)
+    if path.is_absolute():
+        return path.expanduser().resolve()
+    return (_resolve_base(working_directory) / file_path).resolve()
+
+
+# Suffix rules checked via the C-level tuple fast path of str.endswith
+_SUFFIX_SKIP = (".egg-info",)
+
+
+def _should_skip(name: str, show_hidden: bool, ignored: frozenset) -> bool:
+    """Filter for directory listings: hidden entries, known junk dirs, egg-info.
+
+    Module-level so the hot scandir loops call a plain function with locally
+    bound arguments instead of rebuilding a closure over `self` per invocation.
+    Branches are ordered most-selective-first for dot-heavy trees.
+    """
+    if not show_hidden and name.startswith("."):
+        return True
+    if name in ignored:
+        return True
+    return name.endswith(_SUFFIX_SKIP)
+
+
+def _parallel_scan(root: str, max_depth: int, should_skip, approx_limit: int) -> dict[str, tuple[list[str], list[str]]]:
+    """Scan a directory tree with scandir calls overlapped across a thread pool.
+
+    Returns {dir_path: (sorted file names, sorted subdir paths)}. Only
+    directories that were actually scanned (level < max_depth) appear as keys.
+    Descending stops once roughly approx_limit entries have been seen; callers
+    restore deterministic ordering when assembling output.
+    """
+
+    def scan_dir(dir_path: str) -> tuple[str, list[str], list[str]]:
+        try:
+            with os.scandir(dir_path) as it:
+                entries = [e for e in it if not should_skip(e.name)]
+        except OSError:
+            return dir_path, [], []
+        files = []
+        subdirs = []
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+            else:
+                files.append(entry.name)
+        files.sort()
+        subdirs.sort()
+        return dir_path, files, subdirs
+
+    results: dict[str, tuple[list[str], list[str]]] = {}
+    seen = 0
+    frontier = [root]
+    level = 0
+    with ThreadPoolExecutor(max_workers=_WALK_WORKERS) as pool:
+        while frontier:
+            next_frontier = []
+            for dir_path, files, subdirs in pool.map(scan_dir, frontier):
+                results[dir_path] = (files, subdirs)
+                seen += len(files) + len(subdirs)
+                next_frontier.extend(subdirs)
+            level += 1
+            if level >= max_depth or seen >= approx_limit:
+                break
+            frontier = next_frontier
+    return results
+
+
+def _find_files_parallel(root: str, name_pattern: str, max_results: int) -> list[str]:
+    """Python fallback for FindFilesTool: breadth-first parallel walk matching
+    file names against the glob pattern, stopping early once max_results is
+    exceeded."""
+
+    def scan_dir(dir_path: str) -> tuple[list[str], list[str]]:
+        try:
+            with os.scandir(dir_path) as it:
+                entries = list(it)
+        except OSError:
+            return [], []
+        files = []
+        subdirs = []
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+            else:
+                files.append(entry.path)
+        return files, subdirs
+
+    # Compile the glob once; fnmatch.fnmatch would re-translate it per file
+    name_regex = re.compile(fnmatch.translate(name_pattern))
+
+    matches: list[str] = []
+    frontier = [root]
+    with ThreadPoolExecutor(max_workers=_WALK_WORKERS) as pool:
+        while frontier and len(matches) <= max_results:
+            next_frontier = []
+            for files, subdirs in pool.map(scan_dir, frontier):
+                for file_path in files:
+                    if name_regex.match(os.path.basename(file_path)):
+                        matches.append(file_path)
+                next_frontier.extend(subdirs)
+                if len(matches) > max_results:
+                    break
+            frontier = next_frontier
+    matches.sort()
+    return matches
+
 
 class ReadFileTool(BaseTool):
     """Read file contents from the repository.
@@ -27,36 +182,104 @@ class ReadFileTool(BaseTool):
     start_line: int | None = Field(default=None, description="Optional starting line number (1-indexed)")
     end_line: int | None = Field(default=None, description="Optional ending line number (1-indexed)")
 
+    # Below this size mmap setup costs more than it saves
+    MMAP_MIN_SIZE: ClassVar[int] = 64 * 1024
+
+    def _render(self, total_label: str, lines: list[str], first_line_number: int) -> str:
+        """Build the numbered output in one StringIO buffer instead of a list
+        of per-line strings joined at the end (halves peak memory)."""
+        buf = io.StringIO()
+        buf.write(f"File: {self.file_path}\nTotal lines: {total_label}\n\n")
+        line_number = first_line_number
+        for i, line in enumerate(lines):
+            if i:
+                buf.write("\n")
+            buf.write(str(line_number))
+            buf.write("|")
+            buf.write(line.rstrip())
+            line_number += 1
+        return buf.getvalue()
+
+    def _read_sync(self, path: Path) -> str:
+        """Blocking read and line formatting; runs in a worker thread.
+
+        Large files are read through mmap so a small line range only touches
+        the pages up to end_line instead of copying the whole file. The
+        reported total gets a "+" suffix when the scan stopped early and the
+        real total is unknown.
+        """
+        if path.stat().st_size < self.MMAP_MIN_SIZE:
+            with open(path, "r", encoding="utf-8", errors="replace") as f:
+                lines = f.readlines()
+
+            total_lines = len(lines)
+            if self.start_line is not None or self.end_line is not None:
+                start = (self.start_line or 1) - 1
+                lines = lines[start:(self.end_line or total_lines)]
+                return self._render(str(total_lines), lines, start + 1)
+            return self._render(str(total_lines), lines, 1)
+
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if hasattr(mmap, "MADV_SEQUENTIAL"):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+
+            if self.start_line is None and self.end_line is None:
+                lines = bytes(mm).decode("utf-8", "replace").splitlines()
+                return self._render(str(len(lines)), lines, 1)
+
+            start = (self.start_line or 1) - 1
+            end = self.end_line
+            file_size = len(mm)
+
+            # Scan newline offsets lazily, stopping once end_line is reached
+            offset = 0
+            lines_seen = 0
+            start_off = None
+            end_off = None
+            scanned_to_eof = False
+            while True:
+                if start_off is None and lines_seen == start:
+                    start_off = offset
+                if end is not None and lines_seen == end:
+                    end_off = offset
+                    break
+                newline_pos = mm.find(b"\n", offset)
+                if newline_pos == -1:
+                    if offset < file_size:
+                        lines_seen += 1  # trailing line without newline
+                    end_off = file_size
+                    scanned_to_eof = True
+                    break
+                offset = newline_pos + 1
+                lines_seen += 1
+
+            if start_off is None:
+                start_off = file_size
+
+            # O(1) view slice, then one copy of just the requested range;
+            # release before the mmap context closes (close() rejects live views)
+            mv = memoryview(mm)
+            try:
+                chunk = bytes(mv[start_off:end_off])
+            finally:
+                mv.release()
+            lines = chunk.decode("utf-8", "replace").splitlines()
+            total_label = str(lines_seen) if scanned_to_eof else f"{lines_seen}+"
+            return self._render(total_label, lines, start + 1)
+
     async def __call__(self, context: "ResearchContext") -> str:
         try:
             # Resolve path relative to working directory
-            if not Path(self.file_path).is_absolute():
-                base_path = Path(context.working_directory).expanduser().resolve()
-                path = (base_path / self.file_path).resolve()
-            else:
-                path = Path(self.file_path).expanduser().resolve()
-            
+            path = _resolve_rel(context.working_directory, self.file_path)
+
             if not path.exists():
                 return f"Error: File not found: {self.file_path}"
-            
+
             if not path.is_file():
                 return f"Error: Path is not a file: {self.file_path}"
-            
-            with open(path, "r", encoding="utf-8", errors="replace") as f:
-                lines = f.readlines()
-            
-            total_lines = len(lines)
-            
-            if self.start_line is not None or self.end_line is not None:
-                start = (self.start_line or 1) - 1
-                end = (self.end_line or total_lines)
-                lines = lines[start:end]
-                result_lines = [f"{i + start + 1}|{line.rstrip()}" for i, line in enumerate(lines)]
-            else:
-                result_lines = [f"{i + 1}|{line.rstrip()}" for i, line in enumerate(lines)]
-            
-            return f"File: {self.file_path}\nTotal lines: {total_lines}\n\n" + "\n".join(result_lines)
-            
+
+            return await asyncio.to_thread(self._read_sync, path)
+
         except Exception as e:
             logger.error(f"Error reading file {self.file_path}: {e}")
             return f"Error reading file: {str(e)}"
@@ -72,22 +295,39 @@ class WriteFileTool(BaseTool):
     content: str = Field(description="Complete content to write to the file")
     create_dirs: bool = Field(default=True, description="Create parent directories if they don't exist")
 
+    # Above this size a single C-level encode + raw os.write beats the
+    # chunked TextIOWrapper encoding loop
+    RAW_WRITE_MIN_SIZE: ClassVar[int] = 64 * 1024
+
+    def _write_sync(self, path: Path) -> None:
+        """Blocking write; runs in a worker thread."""
+        if len(self.content) < self.RAW_WRITE_MIN_SIZE:
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(self.content)
+            return
+
+        data = self.content.encode("utf-8")
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            view = memoryview(data)
+            while view:
+                written = os.write(fd, view)
+                view = view[written:]
+        finally:
+            os.close(fd)
+
     async def __call__(self, context: "ResearchContext") -> str:
         try:
             # Resolve path relative to working directory
-            if not Path(self.file_path).is_absolute():
-                base_path = Path(context.working_directory).expanduser().resolve()
-                path = (base_path / self.file_path).resolve()
-            else:
-                path = Path(self.file_path).expanduser().resolve()
+            path = _resolve_rel(context.working_directory, self.file_path)
             
             if self.create_dirs:
                 path.parent.mkdir(parents=True, exist_ok=True)
-            
-            with open(path, "w", encoding="utf-8") as f:
-                f.write(self.content)
-            
-            lines_count = len(self.content.splitlines())
+
+            await asyncio.to_thread(self._write_sync, path)
+
+            # C-level newline count instead of materializing every line
+            lines_count = self.content.count("\n") + (1 if self.content and not self.content.endswith("\n") else 0)
             return f"Successfully wrote {lines_count} lines to {self.file_path}"
             
         except Exception as e:
@@ -105,35 +345,51 @@ class EditFileTool(BaseTool):
     search_text: str = Field(description="Exact text to search for (must be unique in the file)")
     replace_text: str = Field(description="Text to replace the search text with")
 
+    def _edit_sync(self, path: Path) -> str:
+        """Blocking read/replace/write; runs in a worker thread so the large
+        file content never crosses back to the event loop."""
+        with open(path, "r", encoding="utf-8") as f:
+            content = f.read()
+
+        # Single find pass instead of `in` + count() + replace() (three scans)
+        first = content.find(self.search_text)
+        if first < 0:
+            return f"Error: Search text not found in {self.file_path}"
+
+        if content.find(self.search_text, first + 1) >= 0:
+            return f"Error: Search text appears multiple times in {self.file_path}. Please make search text more specific."
+
+        new_content = content[:first] + self.replace_text + content[first + len(self.search_text):]
+
+        # Write to a temp file in the same directory and swap atomically so a
+        # crash mid-write can't leave a truncated file behind
+        mode = stat.S_IMODE(os.stat(path).st_mode)
+        fd, tmp_path = tempfile.mkstemp(dir=str(path.parent), prefix=f".{path.name}.", suffix=".tmp")
+        try:
+            # mkstemp creates 0600; carry over the original permissions
+            os.fchmod(fd, mode)
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(new_content)
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+        return f"Successfully edited {self.file_path}"
+
     async def __call__(self, context: "ResearchContext") -> str:
         try:
             # Resolve path relative to working directory
-            if not Path(self.file_path).is_absolute():
-                base_path = Path(context.working_directory).expanduser().resolve()
-                path = (base_path / self.file_path).resolve()
-            else:
-                path = Path(self.file_path).expanduser().resolve()
-            
+            path = _resolve_rel(context.working_directory, self.file_path)
+
             if not path.exists():
                 return f"Error: File not found: {self.file_path}"
-            
-            with open(path, "r", encoding="utf-8") as f:
-                content = f.read()
-            
-            if self.search_text not in content:
-                return f"Error: Search text not found in {self.file_path}"
-            
-            count = content.count(self.search_text)
-            if count > 1:
-                return f"Error: Search text appears {count} times in {self.file_path}. Please make search text more specific."
-            
-            new_content = content.replace(self.search_text, self.replace_text, 1)
-            
-            with open(path, "w", encoding="utf-8") as f:
-                f.write(new_content)
-            
-            return f"Successfully edited {self.file_path}"
-            
+
+            return await asyncio.to_thread(self._edit_sync, path)
+
         except Exception as e:
             logger.error(f"Error editing file {self.file_path}: {e}")
             return f"Error editing file: {str(e)}"
@@ -147,32 +403,85 @@ class GrepTool(BaseTool):
 
     # Note: Field renamed from 'pattern' to 'search_pattern' for Cerebras API compatibility
     # Cerebras confuses property names with JSON schema keywords
-    search_pattern: str = Field(description="Search pattern (supports regex)")
+    search_pattern: str = Field(description="Search pattern (Perl-style regex, e.g. \\d, \\w supported)")
     path: str = Field(default=".", description="Directory or file to search in")
     case_insensitive: bool = Field(default=False, description="Perform case-insensitive search")
     file_filter: str | None = Field(default=None, description="File pattern to filter (e.g., '*.py')")
     context_lines: int = Field(default=0, description="Number of context lines to show before/after match")
     max_results: int = Field(default=100, description="Maximum number of results to return")
 
+    def _grep_file_sync(self, path: Path) -> str:
+        """Scan a single file in-process with a cached compiled pattern.
+
+        For one-file targets the regex compile (cached) plus a Python loop is
+        cheaper than fork+exec of grep/rg.
+        """
+        pattern = _compile_search_pattern(self.search_pattern, self.case_insensitive)
+        lines = []
+        truncated = False
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            for line_number, line in enumerate(f, start=1):
+                if pattern.search(line):
+                    lines.append(f"{path}:{line_number}:{line.rstrip()}")
+                    if len(lines) >= self.max_results:
+                        truncated = True
+                        break
+
+        if not lines:
+            return f"No matches found for pattern: {self.search_pattern}"
+
+        result = "\n".join(lines)
+        if truncated:
+            result += f"\n\n... (truncated, showing first {self.max_results} results)"
+        return f"Search results for '{self.search_pattern}':\n\n{result}"
+
     async def __call__(self, context: "ResearchContext") -> str:
         try:
             # Resolve search path relative to working directory
             search_path = self.path
             if not Path(search_path).is_absolute():
-                base_path = Path(context.working_directory).expanduser().resolve()
+                base_path = _resolve_base(context.working_directory)
                 search_path = str((base_path / search_path).resolve())
-            
-            cmd = ["grep", "-r", "-n"]
-            
-            if self.case_insensitive:
-                cmd.append("-i")
-            
-            if self.context_lines > 0:
-                cmd.extend(["-C", str(self.context_lines)])
-            
-            if self.file_filter:
-                cmd.extend(["--include", self.file_filter])
-            
+
+            # Single-file targets skip the subprocess entirely; context-line
+            # requests stay on grep/rg rather than reimplementing -C here
+            if self.context_lines == 0 and Path(search_path).is_file():
+                return await asyncio.to_thread(self._grep_file_sync, Path(search_path))
+
+            if _RG_PATH:
+                # --hidden/--no-ignore match grep -r coverage: rg would
+                # otherwise skip dotfiles and .gitignore'd paths
+                cmd = [
+                    _RG_PATH,
+                    "--line-number",
+                    "--no-heading",
+                    "--color=never",
+                    "--no-messages",
+                    "--hidden",
+                    "--no-ignore",
+                    "--max-count",
+                    str(self.max_results),
+                ]
+                if self.case_insensitive:
+                    cmd.append("-i")
+                if self.context_lines > 0:
+                    cmd.extend(["-C", str(self.context_lines)])
+                if self.file_filter:
+                    cmd.extend(["-g", self.file_filter])
+            else:
+                # -P keeps the pattern dialect aligned with rg and the Python
+                # in-process path (Perl-style \d/\w, grouping without
+                # backslashes) instead of POSIX BRE. -m caps matches per file
+                # so grep exits early instead of producing output the Python
+                # side would discard anyway
+                cmd = ["grep", "-r", "-n", "-P", "-m", str(self.max_results)]
+                if self.case_insensitive:
+                    cmd.append("-i")
+                if self.context_lines > 0:
+                    cmd.extend(["-C", str(self.context_lines)])
+                if self.file_filter:
+                    cmd.extend(["--include", self.file_filter])
+
             cmd.append(self.search_pattern)
             cmd.append(search_path)
             
@@ -180,25 +489,34 @@ class GrepTool(BaseTool):
                 *cmd,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
+                limit=2**20,
             )
-            
-            stdout, stderr = await process.communicate()
-            
-            if process.returncode != 0 and process.returncode != 1:
+
+            # Stream stdout line-by-line and stop as soon as max_results is
+            # reached instead of buffering the full match set in memory
+            stderr_task = asyncio.create_task(process.stderr.read())
+            lines = []
+            truncated = False
+            async for raw_line in process.stdout:
+                lines.append(raw_line.decode(errors="replace").rstrip("\n"))
+                if len(lines) >= self.max_results:
+                    truncated = True
+                    process.terminate()
+                    break
+
+            stderr = await stderr_task
+            await process.wait()
+
+            if not truncated and process.returncode != 0 and process.returncode != 1:
                 return f"Error running grep: {stderr.decode()}"
-            
-            output = stdout.decode()
-            
-            if not output:
+
+            if not lines:
                 return f"No matches found for pattern: {self.search_pattern}"
-            
-            lines = output.splitlines()
-            if len(lines) > self.max_results:
-                lines = lines[:self.max_results]
-                result = "\n".join(lines) + f"\n\n... (truncated, showing first {self.max_results} results)"
-            else:
-                result = "\n".join(lines)
-            
+
+            result = "\n".join(lines)
+            if truncated:
+                result += f"\n\n... (truncated, showing first {self.max_results} results)"
+
             return f"Search results for '{self.search_pattern}':\n\n{result}"
             
         except Exception as e:
@@ -217,33 +535,93 @@ class RunCommandTool(BaseTool):
     working_dir: str = Field(default=".", description="Working directory for command execution")
     timeout: int = Field(default=30, description="Timeout in seconds")
 
+    # Cap captured output so a verbose build/test run cannot exhaust memory;
+    # only the most recent MAX_CAPTURE_BYTES of each stream are kept
+    MAX_CAPTURE_BYTES: ClassVar[int] = 2 * 1024 * 1024
+    READ_CHUNK_SIZE: ClassVar[int] = 64 * 1024
+
+    @classmethod
+    async def _drain_stream(cls, stream, chunks: deque) -> int:
+        """Read a stream to EOF into a bounded deque, returning total bytes seen."""
+        total = 0
+        while True:
+            chunk = await stream.read(cls.READ_CHUNK_SIZE)
+            if not chunk:
+                return total
+            total += len(chunk)
+            chunks.append(chunk)
+
+    @staticmethod
+    async def _kill_and_wait(process) -> None:
+        """Kill the whole process group and reap the shell deterministically.
+
+        Killing only the `sh -c` parent leaves grandchildren running, and
+        skipping the wait() leaves a zombie holding FDs until GC.
+        """
+        try:
+            # start_new_session=True below makes the pid the pgid
+            os.killpg(process.pid, signal.SIGKILL)
+        except (ProcessLookupError, PermissionError):
+            try:
+                process.kill()
+            except ProcessLookupError:
+                pass
+        try:
+            await asyncio.wait_for(process.wait(), timeout=2)
+        except asyncio.TimeoutError:
+            logger.warning("Timed-out command did not exit after SIGKILL")
+
+    @staticmethod
+    def _assemble_stream(chunks: deque, total: int) -> str:
+        data = b"".join(chunks)
+        text = data.decode(errors="replace")
+        if total > len(data):
+            text = f"... (truncated, showing last {len(data)} of {total} bytes)\n{text}"
+        return text
+
     async def __call__(self, context: "ResearchContext") -> str:
         try:
             # Resolve working directory relative to context working directory
             work_dir = self.working_dir
             if not Path(work_dir).is_absolute():
-                base_path = Path(context.working_directory).expanduser().resolve()
+                base_path = _resolve_base(context.working_directory)
                 work_dir = str((base_path / work_dir).resolve())
-            
+
             process = await asyncio.create_subprocess_shell(
                 self.command,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
                 cwd=work_dir,
+                start_new_session=True,
             )
-            
+
+            # Stream both pipes into ring buffers instead of communicate(),
+            # which would buffer unbounded output in memory
+            maxlen = self.MAX_CAPTURE_BYTES // self.READ_CHUNK_SIZE
+            stdout_chunks: deque = deque(maxlen=maxlen)
+            stderr_chunks: deque = deque(maxlen=maxlen)
+            stdout_task = asyncio.create_task(self._drain_stream(process.stdout, stdout_chunks))
+            stderr_task = asyncio.create_task(self._drain_stream(process.stderr, stderr_chunks))
+
             try:
-                stdout, stderr = await asyncio.wait_for(
-                    process.communicate(), 
-                    timeout=self.timeout
-                )
+                await asyncio.wait_for(process.wait(), timeout=self.timeout)
             except asyncio.TimeoutError:
-                process.kill()
-                return f"Error: Command timed out after {self.timeout} seconds"
-            
-            output = stdout.decode()
-            error = stderr.decode()
-            
+                await self._kill_and_wait(process)
+                # Drain tasks finish on EOF once the process is gone
+                stdout_total = await stdout_task
+                stderr_total = await stderr_task
+                result = f"Error: Command timed out after {self.timeout} seconds"
+                tail = self._assemble_stream(stdout_chunks, stdout_total)
+                if tail:
+                    result += f"\n\nPartial STDOUT:\n{tail}"
+                tail = self._assemble_stream(stderr_chunks, stderr_total)
+                if tail:
+                    result += f"\n\nPartial STDERR:\n{tail}"
+                return result
+
+            output = self._assemble_stream(stdout_chunks, await stdout_task)
+            error = self._assemble_stream(stderr_chunks, await stderr_task)
+
             result = f"Command: {self.command}\n"
             result += f"Exit code: {process.returncode}\n\n"
             
@@ -277,23 +655,23 @@ class ListDirectoryTool(BaseTool):
     max_items: int = Field(default=500, description="Maximum number of items to show (to prevent context overflow)")
     
     # Directories to always skip (even if show_hidden=True)
-    IGNORED_DIRS: ClassVar[set[str]] = {
+    IGNORED_DIRS: ClassVar[frozenset[str]] = frozenset({
         '.venv', 'venv', '.env', 'env',
         'node_modules', 'bower_components',
         '.git', '.svn', '.hg',
         '__pycache__', '.pytest_cache', '.mypy_cache', '.ruff_cache',
-        '.tox', '.nox', '.eggs', '*.egg-info',
+        '.tox', '.nox', '.eggs',
         'dist', 'build', '.dist-info',
         '.idea', '.vscode', '.vs',
         'coverage', '.coverage', 'htmlcov',
         '.DS_Store', 'Thumbs.db',
-    }
+    })
 
     async def __call__(self, context: "ResearchContext") -> str:
         try:
             # Resolve path relative to working directory
             if not Path(self.path).is_absolute():
-                base_path = Path(context.working_directory).expanduser().resolve()
+                base_path = _resolve_base(context.working_directory)
                 path = (base_path / self.path).resolve()
             else:
                 path = Path(self.path).expanduser().resolve()
@@ -305,67 +683,64 @@ class ListDirectoryTool(BaseTool):
                 return f"Error: Path is not a directory: {self.path}"
             
             result = f"Contents of {self.path}:\n\n"
-            
-            def should_skip(name: str) -> bool:
-                """Check if directory/file should be skipped."""
-                # Skip hidden files/dirs if show_hidden=False
-                if not self.show_hidden and name.startswith("."):
-                    return True
-                # Always skip ignored directories
-                if name in self.IGNORED_DIRS:
-                    return True
-                # Skip egg-info directories
-                if name.endswith('.egg-info'):
-                    return True
-                return False
-            
+
+            # Bind the filter arguments once; attribute lookups inside the
+            # per-entry loops below are measurable on large directories
+            show_hidden = self.show_hidden
+            ignored = self.IGNORED_DIRS
+            should_skip = functools.partial(_should_skip, show_hidden=show_hidden, ignored=ignored)
+
             if self.recursive:
                 items = []
                 truncated = False
-                for root, dirs, files in os.walk(path):
-                    # Filter out ignored directories in-place
-                    dirs[:] = [d for d in dirs if not should_skip(d)]
-                    
-                    level = root.replace(str(path), "").count(os.sep)
-                    if level >= self.max_depth:
-                        dirs.clear()
-                        continue
-                    
-                    indent = "  " * level
-                    rel_root = os.path.relpath(root, path)
-                    if rel_root != ".":
+
+                # Scan in parallel (unordered), then assemble the tree
+                # serially so the output stays deterministic
+                scanned = await asyncio.to_thread(
+                    _parallel_scan, str(path), self.max_depth, should_skip, self.max_items
+                )
+
+                def assemble(dir_path: str, level: int, name: str | None) -> None:
+                    nonlocal truncated
+                    if truncated:
+                        return
+                    if name is not None:
                         if len(items) >= self.max_items:
                             truncated = True
-                            break
-                        items.append(f"{indent}{os.path.basename(root)}/")
-                    
-                    for file in sorted(files):
-                        if should_skip(file):
-                            continue
+                            return
+                        items.append(f"{'  ' * level}{name}/")
+
+                    files, subdirs = scanned.get(dir_path, ([], []))
+                    for file in files:
                         if len(items) >= self.max_items:
                             truncated = True
-                            break
-                        items.append(f"{indent}  {file}")
-                    
-                    if truncated:
-                        break
-                
+                            return
+                        items.append(f"{'  ' * level}  {file}")
+
+                    for subdir in subdirs:
+                        if subdir in scanned:
+                            assemble(subdir, level + 1, os.path.basename(subdir))
+
+                assemble(str(path), 0, None)
+
                 result += "\n".join(items)
                 if truncated:
                     result += f"\n\n... (truncated, showing first {self.max_items} items)"
             else:
-                items = sorted(path.iterdir(), key=lambda x: (not x.is_dir(), x.name))
+                with os.scandir(path) as it:
+                    entries = sorted(it, key=lambda e: (not e.is_dir(follow_symlinks=False), e.name))
                 lines = []
-                for item in items:
-                    if should_skip(item.name):
+                skip = _should_skip
+                for entry in entries:
+                    if skip(entry.name, show_hidden, ignored):
                         continue
-                    
-                    if item.is_dir():
-                        lines.append(f"  {item.name}/")
+
+                    if entry.is_dir(follow_symlinks=False):
+                        lines.append(f"  {entry.name}/")
                     else:
-                        size = item.stat().st_size
-                        lines.append(f"  {item.name} ({size} bytes)")
-                
+                        size = entry.stat(follow_symlinks=False).st_size
+                        lines.append(f"  {entry.name} ({size} bytes)")
+
                 result += "\n".join(lines)
             
             return result
@@ -391,29 +766,44 @@ class FindFilesTool(BaseTool):
             # Resolve search path relative to working directory
             search_path = self.path
             if not Path(search_path).is_absolute():
-                base_path = Path(context.working_directory).expanduser().resolve()
+                base_path = _resolve_base(context.working_directory)
                 search_path = str((base_path / search_path).resolve())
             
-            cmd = ["find", search_path, "-type", "f", "-name", self.name_pattern]
-            
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
-            
-            stdout, stderr = await process.communicate()
-            
-            if process.returncode != 0:
-                return f"Error running find: {stderr.decode()}"
-            
-            output = stdout.decode().strip()
-            
-            if not output:
+            if _RG_PATH:
+                # --hidden/--no-ignore match the Python fallback's coverage:
+                # rg would otherwise skip dotfiles and .gitignore'd paths
+                cmd = [
+                    _RG_PATH,
+                    "--files",
+                    "--no-messages",
+                    "--hidden",
+                    "--no-ignore",
+                    "-g",
+                    self.name_pattern,
+                    search_path,
+                ]
+
+                process = await asyncio.create_subprocess_exec(
+                    *cmd,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                )
+
+                stdout, stderr = await process.communicate()
+
+                # rg exits 1 when nothing matched; that's not an error
+                if process.returncode not in (0, 1):
+                    return f"Error running find: {stderr.decode()}"
+
+                files = stdout.decode().strip().splitlines()
+            else:
+                files = await asyncio.to_thread(
+                    _find_files_parallel, search_path, self.name_pattern, self.max_results
+                )
+
+            if not files:
                 return f"No files found matching pattern: {self.name_pattern}"
-            
-            files = output.splitlines()
-            
+
             if len(files) > self.max_results:
                 files = files[:self.max_results]
                 result = "\n".join(files) + f"\n\n... (truncated, showing first {self.max_results} results)"
@@ -138,10 +138,9 @@ class WebSearchTool(BaseTool):
 
         sources = TavilySearchService.rearrange_sources(sources, starting_number=len(context.sources) + 1)
 
-        for source in sources:
-            context.sources[source.url] = source
+        context.extend_sources((source.url, source) for source in sources)
 
-        search_result = SearchResult(
+        search_result = SearchResult.build_trusted(
             query=self.query,
             answer=None,
             citations=sources,
@@ -69,7 +69,7 @@ class TavilySearchService:
             if not result.get("url"):
                 continue
 
-            source = SourceData(
+            source = SourceData.build_trusted(
                 number=i,
                 title=result.get("url", "").split("/")[-1] or "Extracted Content",
                 url=result.get("url", ""),
@@ -93,7 +93,7 @@ class TavilySearchService:
             if not result.get("url", ""):
                 continue
 
-            source = SourceData(
+            source = SourceData.build_trusted(
                 number=i,
                 title=result.get("title", ""),
                 url=result.get("url", ""),